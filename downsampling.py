@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+# Nombre max de points envoyés au navigateur par série (≈ résolution horizontale du graphique)
+MAX_POINTS_PAR_SERIE = 800
+
+
+def lttb_indices(x, y, n_out):
+    """Indices conservés par l'algorithme Largest-Triangle-Three-Buckets."""
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 3:
+        # Pas de bucket intermédiaire possible : on garde les extrémités
+        return np.array([0, n - 1])
+    bucket_size = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        # Point moyen du bucket suivant
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Point du bucket courant formant le plus grand triangle avec a et le point moyen
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        indices[i + 1] = a
+    indices[-1] = n - 1
+    return indices
+
+
+def downsample(df_plot, x_col, y_col, n_out=MAX_POINTS_PAR_SERIE):
+    """Sous-échantillonne chaque ticker en gardant une ligne NaN par trou pour que la courbe reste coupée."""
+    parts = []
+    for _, g in df_plot.groupby("ticker", sort=False):
+        g = g.sort_values(x_col, kind="stable")
+        missing = g[y_col].isna().to_numpy()
+        valid_pos = np.flatnonzero(~missing)
+        x = g[x_col].iloc[valid_pos].astype("int64").to_numpy(dtype=float)
+        y = g[y_col].iloc[valid_pos].to_numpy(dtype=float)
+        kept = valid_pos[lttb_indices(x, y, n_out)]
+        # Première ligne de chaque séquence de NaN
+        gap_starts = np.flatnonzero(missing & ~np.r_[False, missing[:-1]])
+        parts.append(g.iloc[np.sort(np.r_[kept, gap_starts])])
+    if not parts:
+        return df_plot.iloc[0:0]
+    return pd.concat(parts)
@@ -3,6 +3,8 @@ import pandas as pd
 import plotly.express as px
 import os
 
+from downsampling import downsample
+
 st.set_page_config(layout="wide", page_title="Historique des métriques fondamentales")
 st.title("📊 Exploration des métriques fondamentales")
 
@@ -43,6 +45,62 @@ df, scores = load_data()
 if df.empty:
     st.stop()
 
+# ==== Graphiques ====
+# Au-delà de ce nombre total de points, passage en rendu WebGL (Scattergl)
+SEUIL_WEBGL = 5000
+
+@st.cache_data
+def load_plot_data(source, tickers, y_col, debut, fin):
+    """Série sous-échantillonnée, mise en cache par (source, tickers, métrique, période)."""
+    data = load_data()[0 if source == "df" else 1]
+    df_plot = data.loc[data["ticker"].isin(tickers), ["ticker", "date", y_col]].copy()
+    df_plot["date"] = pd.to_datetime(df_plot["date"])
+    if debut is not None:
+        df_plot = df_plot[(df_plot["date"].dt.date >= debut) & (df_plot["date"].dt.date <= fin)]
+    return downsample(df_plot, "date", y_col)
+
+def select_periode(dates, key):
+    """Fenêtre de dates affichée : la réduire redemande des données plus résolues."""
+    dates = pd.to_datetime(dates).dropna()
+    if dates.empty:
+        return None, None
+    d_min, d_max = dates.min().date(), dates.max().date()
+    if d_min == d_max:
+        return d_min, d_max
+    # Fenêtre choisie conservée quand la sélection change, ramenée dans les nouvelles bornes
+    bornes_key = f"{key}_bornes"
+    old_min, old_max = st.session_state.get(bornes_key, (d_min, d_max))
+    debut, fin = st.session_state.get(key, (d_min, d_max))
+    # Une fenêtre calée sur une borne suit cette borne (nouvelle snapshot après rafraîchissement)
+    if debut == old_min:
+        debut = d_min
+    if fin == old_max:
+        fin = d_max
+    if fin < d_min or debut > d_max:
+        debut, fin = d_min, d_max
+    else:
+        debut, fin = max(debut, d_min), min(fin, d_max)
+    st.session_state[bornes_key] = (d_min, d_max)
+    st.session_state[key] = (debut, fin)
+    return st.sidebar.slider("Période affichée", min_value=d_min, max_value=d_max, key=key)
+
+def line_chart(source, tickers, y_col, periode, title, labels):
+    """Courbe par ticker sur axe temporel, sous-échantillonnée et en WebGL si volumineuse."""
+    df_plot = load_plot_data(source, tuple(tickers), y_col, *periode)
+    n_points = len(df_plot)
+    fig = px.line(
+        df_plot,
+        x="date",
+        y=y_col,
+        color="ticker",
+        markers=n_points <= SEUIL_WEBGL,
+        render_mode="webgl" if n_points > SEUIL_WEBGL else "svg",
+        title=title,
+        labels=labels
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
 # Info de dernière mise à jour
 last_update = df["horodatage"].max()
 if pd.notna(last_update):
@@ -100,20 +158,15 @@ if view == "Métriques":
         st.warning(f"La métrique {metric} n'existe pas.")
     else:
         if not df_filtered.empty:
-            df_plot = df_filtered.copy()
-            df_plot["date_snapshot"] = pd.to_datetime(df_plot["date"]).dt.date
-            df_plot = df_plot.sort_values(["ticker", "date_snapshot"])
-            fig = px.line(
-                df_plot,
-                x="date_snapshot",
-                y=metric,
-                color="ticker",
-                markers=True,
+            periode_metrics = select_periode(df_filtered["date"], key="metrics_periode")
+            fig = line_chart(
+                "df",
+                tickers_metrics,
+                metric,
+                periode_metrics,
                 title=f"{metric} — évolution",
-                labels={metric: metric, "date_snapshot": "Date"}
+                labels={metric: metric, "date": "Date"}
             )
-            fig.update_xaxes(type="category")
-            fig.update_layout(xaxis_tickangle=-45)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Aucune donnée pour la sélection métrique.")
@@ -186,20 +239,15 @@ else:
     if scores_filtered.empty:
         st.warning("Aucune donnée de score pour la sélection.")
     else:
-        scores_filtered_plot = scores_filtered.copy()
-        scores_filtered_plot["date_snapshot"] = pd.to_datetime(scores_filtered_plot["date"]).dt.date
-        scores_filtered_plot = scores_filtered_plot.sort_values(["ticker", "date_snapshot"])
-        fig_score = px.line(
-            scores_filtered_plot,
-            x="date_snapshot",
-            y="Score_sur_20",
-            color="ticker",
-            markers=True,
+        periode_scores = select_periode(scores_filtered["date"], key="scores_periode")
+        fig_score = line_chart(
+            "scores",
+            tickers_scores,
+            "Score_sur_20",
+            periode_scores,
             title="Évolution du Score sur 20",
-            labels={"Score_sur_20": "Score / 20", "date_snapshot": "Date"}
+            labels={"Score_sur_20": "Score / 20", "date": "Date"}
         )
-        fig_score.update_xaxes(type="category")
-        fig_score.update_layout(xaxis_tickangle=-45)
         st.plotly_chart(fig_score, use_container_width=True)
 
         st.subheader(f"Classement sur la dernière date ({scores['date'].max()})")
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from downsampling import downsample, lttb_indices
+
+
+def test_lttb_longueur_et_extremites():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    idx = lttb_indices(x, y, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_conserve_pic_isole():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 50.0
+    assert 437 in lttb_indices(x, y, 50)
+
+
+def test_lttb_serie_courte_inchangee():
+    x = np.arange(10, dtype=float)
+    assert np.array_equal(lttb_indices(x, x, 10), np.arange(10))
+    assert np.array_equal(lttb_indices(x, x, 50), np.arange(10))
+
+
+def test_lttb_petit_n_out_garde_extremites():
+    x = np.arange(100, dtype=float)
+    assert np.array_equal(lttb_indices(x, x, 1), [0, 99])
+
+
+def test_downsample_garde_les_trous():
+    dates = pd.date_range("2020-01-01", periods=500)
+    values = np.arange(500, dtype=float)
+    values[200:260] = np.nan
+    df_plot = pd.DataFrame({"ticker": "IONQ", "date": dates, "v": values})
+    out = downsample(df_plot, "date", "v", n_out=50)
+    assert out["v"].notna().sum() == 50
+    assert out["v"].isna().sum() == 1
+    assert out["date"].is_monotonic_increasing